@@ -0,0 +1,296 @@
+import os
+import sqlite3
+import tempfile
+import uuid
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+
+# Numeric columns recorded per player per fight in the player_stats table.
+METRIC_COLUMNS = [
+    'damage', 'healing', 'cleanses', 'strips', 'distance',
+    'kills', 'deaths', 'num_fights', 'duration',
+]
+
+
+@st.cache_resource
+def get_db_connection(db_path):
+    """Open one long-lived read-only connection per database.
+
+    The connection is shared across reruns and Streamlit threads, so each
+    query reuses SQLite's page cache instead of paying open/parse/close.
+    Index creation needs write access and runs once on a separate
+    connection before the read-only one opens.
+    """
+    _ensure_indexes(db_path)
+    conn = sqlite3.connect('file:%s?mode=ro&cache=shared' % db_path,
+                           uri=True, check_same_thread=False)
+    conn.execute('PRAGMA cache_size=-65536')
+    conn.execute('PRAGMA mmap_size=268435456')
+    return conn
+
+
+def _ensure_indexes(db_path):
+    """Create the indexes the filtered reads rely on, if missing.
+
+    Without them SQLite falls back to a full-table scan for every sidebar
+    filter change. ANALYZE runs once after creation so the query planner
+    has the statistics to actually pick the composite index.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        existing = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index'")}
+        if 'idx_player_prof_date' in existing and 'idx_date' in existing:
+            return
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_player_prof_date '
+                     'ON player_stats(name, profession, date)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_date ON player_stats(date)')
+        conn.execute('ANALYZE')
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@st.cache_data
+def load_distinct_values(db_path):
+    """Fetch the sidebar widget options in a single metadata query."""
+    conn = get_db_connection(db_path)
+    # char(31) (the unit separator) keeps names containing commas intact.
+    names, professions, date_min, date_max = conn.execute(
+        'SELECT (SELECT GROUP_CONCAT(name, char(31)) FROM '
+        '        (SELECT DISTINCT name FROM player_stats ORDER BY name)), '
+        '       (SELECT GROUP_CONCAT(profession, char(31)) FROM '
+        '        (SELECT DISTINCT profession FROM player_stats ORDER BY profession)), '
+        '       MIN(date), MAX(date) '
+        'FROM player_stats').fetchone()
+    names = names.split('\x1f') if names else []
+    professions = professions.split('\x1f') if professions else []
+    return names, professions, pd.to_datetime(date_min), pd.to_datetime(date_max)
+
+
+@st.cache_data
+def load_filtered(db_path, players, professions, start_date, end_date):
+    """Read only the rows matching the sidebar filters.
+
+    The table is serialized once per database to a zstd Parquet sidecar;
+    after that every load is a columnar read with the sidebar predicates
+    pushed down to pyarrow, skipping SQLite's row-by-row Python adapter.
+    A sidecar older than its database is rebuilt.
+    """
+    parquet_path = db_path + '.parquet'
+    if (not os.path.exists(parquet_path)
+            or os.path.getmtime(parquet_path) < os.path.getmtime(db_path)):
+        _materialize_parquet(db_path, parquet_path)
+
+    filters = [('date', '>=', pd.Timestamp(start_date)),
+               ('date', '<=', pd.Timestamp(end_date))]
+    if players:
+        filters.append(('name', 'in', list(players)))
+    if professions:
+        filters.append(('profession', 'in', list(professions)))
+    return pd.read_parquet(parquet_path, filters=filters)
+
+
+def _materialize_parquet(db_path, parquet_path):
+    try:
+        from adbc_driver_sqlite import dbapi
+    except ImportError:
+        # Fall back to the stdlib driver, which assembles the result one
+        # Python tuple per row before pandas columnarizes it.
+        conn = get_db_connection(db_path)
+        df = pd.read_sql_query('SELECT * FROM player_stats', conn,
+                               parse_dates=['date'])
+    else:
+        with dbapi.connect(db_path) as conn, conn.cursor() as cursor:
+            cursor.execute('SELECT * FROM player_stats')
+            df = cursor.fetch_arrow_table().to_pandas()
+        df['date'] = pd.to_datetime(df['date'])
+    df = _convert_dtypes(df)
+    df.to_parquet(parquet_path, compression='zstd', engine='pyarrow')
+
+
+def _convert_dtypes(df):
+    # Categorical codes make the downstream isin/groupby/unique work on
+    # small integers instead of Python string objects.
+    df['name'] = df['name'].astype('category')
+    df['profession'] = df['profession'].astype('category')
+    # The stat counters all fit in 32 bits; downcasting halves the bytes
+    # every later reduction, groupby, and chart serialization touches.
+    for column in df.select_dtypes(include='integer').columns:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+    for column in df.select_dtypes(include='float').columns:
+        df[column] = pd.to_numeric(df[column], downcast='float')
+    return df
+
+
+@st.cache_data
+def load_trend(db_path, metric, players, professions, start_date, end_date):
+    """Aggregate a metric per (date, name, profession) inside SQLite.
+
+    The trends tab only plots group means, so the groupby runs in SQL and
+    just the aggregated rows cross into pandas. The metric name is checked
+    against METRIC_COLUMNS because it is interpolated into the statement.
+    """
+    if metric not in METRIC_COLUMNS:
+        raise ValueError('unknown metric: %r' % metric)
+    clauses = []
+    params = []
+    if players:
+        clauses.append('name IN (%s)' % ','.join('?' * len(players)))
+        params.extend(players)
+    if professions:
+        clauses.append('profession IN (%s)' % ','.join('?' * len(professions)))
+        params.extend(professions)
+    clauses.append('date BETWEEN ? AND ?')
+    params.extend([str(start_date), str(end_date)])
+
+    query = ('SELECT date, name, profession, AVG("%s") AS "%s" '
+             'FROM player_stats WHERE %s '
+             'GROUP BY date, name, profession' % (metric, metric, ' AND '.join(clauses)))
+    conn = get_db_connection(db_path)
+    return pd.read_sql_query(query, conn, params=params, parse_dates=['date'])
+
+
+def calculate_derived_stat(df, formula):
+    # numexpr evaluates in cache-sized chunks across threads, but carries a
+    # fixed compile cost that is not worth paying on small frames.
+    engine = 'numexpr' if len(df) > 10000 else 'python'
+    return df.eval(formula, engine=engine, parser='pandas')
+
+
+def save_uploaded_file(uploaded_file):
+    path = os.path.join(tempfile.gettempdir(), '%s_%s' % (uuid.uuid4().hex, uploaded_file.name))
+    with open(path, 'wb') as f:
+        f.write(uploaded_file.getbuffer())
+    return path
+
+
+def main():
+    st.set_page_config(page_title='Top Stats Dashboard', layout='wide')
+    st.title('Top Stats Dashboard')
+
+    if 'db_files' not in st.session_state:
+        st.session_state.db_files = {}
+    if 'db_files_by_id' not in st.session_state:
+        st.session_state.db_files_by_id = {}
+
+    uploaded_files = st.sidebar.file_uploader(
+        'Upload stats database', type=['db', 'sqlite', 'sqlite3'],
+        accept_multiple_files=True)
+    if uploaded_files:
+        for uploaded_file in uploaded_files:
+            # Reruns re-deliver every upload; only write files we have not
+            # already saved this session.
+            if uploaded_file.file_id in st.session_state.db_files_by_id:
+                continue
+            path = save_uploaded_file(uploaded_file)
+            st.session_state.db_files_by_id[uploaded_file.file_id] = path
+            st.session_state.db_files[uploaded_file.name] = path
+
+    if not st.session_state.db_files:
+        st.info('Upload a player_stats database to get started.')
+        return
+
+    db_name = st.sidebar.selectbox('Database', sorted(st.session_state.db_files))
+    db_path = st.session_state.db_files[db_name]
+
+    names, professions, date_min, date_max = load_distinct_values(db_path)
+
+    selected_players = st.sidebar.multiselect('Players', names)
+    selected_professions = st.sidebar.multiselect('Professions', professions)
+    date_range = st.sidebar.date_input(
+        'Date range', (date_min.date(), date_max.date()),
+        min_value=date_min.date(), max_value=date_max.date())
+    if len(date_range) == 2:
+        start_date, end_date = date_range
+    else:
+        start_date = end_date = date_range[0]
+
+    filtered_df = load_filtered(
+        db_path, tuple(selected_players), tuple(selected_professions),
+        start_date, end_date)
+
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(
+        ['Overview', 'Performance Trends', 'Custom Stats', 'Bubble Chart', 'Raw Data'])
+
+    with tab1:
+        col1, col2, col3 = st.columns(3)
+        totals = filtered_df[['num_fights', 'duration']].sum()
+        col1.metric('Total Fights', int(totals['num_fights']))
+        col2.metric('Total Duration (s)', int(totals['duration']))
+        col3.metric('Players', filtered_df['name'].nunique())
+
+        st.plotly_chart(
+            px.histogram(filtered_df[['damage', 'profession']], x='damage',
+                         color='profession', title='Damage Distribution'),
+            use_container_width=True)
+
+        top_players = (filtered_df.groupby('name', observed=True, sort=False)['damage']
+                       .sum().nlargest(10).reset_index())
+        st.plotly_chart(
+            px.bar(top_players, x='name', y='damage', title='Top Players by Damage'),
+            use_container_width=True)
+
+    with tab2:
+        metric = st.selectbox('Metric', METRIC_COLUMNS)
+        trend = load_trend(
+            db_path, metric, tuple(selected_players),
+            tuple(selected_professions), start_date, end_date)
+        st.plotly_chart(
+            px.line(trend, x='date', y=metric, color='name',
+                    title='%s over time' % metric),
+            use_container_width=True)
+
+    with tab3:
+        formula = st.text_input('Formula', 'damage / duration')
+        if formula:
+            try:
+                derived = calculate_derived_stat(filtered_df, formula)
+            except Exception as e:
+                st.error('Could not evaluate formula: %s' % e)
+            else:
+                if derived.dtype == bool:
+                    # The numba mean kernel has no bool reduction; the mean
+                    # of a boolean formula is its True fraction, so
+                    # aggregate it as floats.
+                    derived = derived.astype('float64')
+                if not pd.api.types.is_numeric_dtype(derived):
+                    st.error('Formula must produce a numeric result, got %s'
+                             % derived.dtype)
+                else:
+                    filtered_df['derived'] = derived
+                    summary = (filtered_df.groupby('profession', observed=True,
+                                                   sort=False)['derived']
+                               .mean(engine='numba',
+                                     engine_kwargs={'nopython': True, 'nogil': True,
+                                                    'parallel': True})
+                               .reset_index())
+                    st.plotly_chart(
+                        px.bar(summary, x='profession', y='derived',
+                               title='Average of %s by profession' % formula),
+                        use_container_width=True)
+
+    with tab4:
+        x_column = st.selectbox('X axis', METRIC_COLUMNS, index=0)
+        y_column = st.selectbox('Y axis', METRIC_COLUMNS, index=1)
+        size_column = st.selectbox('Size by', METRIC_COLUMNS, index=8)
+        mask = (filtered_df[size_column].notna()
+                & (filtered_df[size_column] >= 0)).to_numpy()
+        bubble_columns = list(dict.fromkeys(
+            [x_column, y_column, size_column, 'profession', 'name', 'date']))
+        bubble_df = filtered_df.loc[mask, bubble_columns]
+        st.plotly_chart(
+            px.scatter(bubble_df, x=x_column, y=y_column, size=size_column,
+                       color='profession', hover_data=['name', 'date']),
+            use_container_width=True)
+
+    with tab5:
+        st.dataframe(filtered_df, use_container_width=True)
+
+
+if __name__ == '__main__':
+    main()
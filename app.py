@@ -1,6 +1,7 @@
 import base64
 import datetime
 import io
+import math
 
 import dash
 from dash import Dash, html, dcc, Input, Output, State, dash_table
@@ -40,6 +41,18 @@ app.layout = html.Div([ # this code section taken from Dash docs https://dash.pl
 ])
 
 
+PAGE_SIZE = 15
+
+
+def df_to_store(df):
+    # Parquet bytes are one columnar payload instead of a dict per row.
+    return base64.b64encode(df.to_parquet()).decode()
+
+
+def df_from_store(stored):
+    return pd.read_parquet(io.BytesIO(base64.b64decode(stored)))
+
+
 def parse_contents(contents, filename, date):
     content_type, content_string = contents.split(',')
 
@@ -47,16 +60,15 @@ def parse_contents(contents, filename, date):
     try:
         if 'csv' in filename:
             # Assume that the user uploaded a CSV file
-            df = pd.read_csv(
-                io.StringIO(decoded.decode('utf-8')))
+            df = pd.read_csv(io.BytesIO(decoded), engine='pyarrow')
         elif 'xls' in filename:
             # Assume that the user uploaded an excel file
-            df = pd.read_excel(io.BytesIO(decoded))
+            df = pd.read_excel(io.BytesIO(decoded), engine='calamine')
             
-        df['DPS'] = df.apply(lambda row: row.Damage / row.Duration, axis=1)
-        df['CPS'] = df.apply(lambda row: row['Condition Cleanses'] / row.Duration, axis=1)
-        df['RPS'] = df.apply(lambda row: row['Boon Strips'] / row.Duration, axis=1)
-        df['HPS'] = df.apply(lambda row: row['Total Healing'] / row.Duration, axis=1)
+        df['DPS'] = df['Damage'] / df['Duration']
+        df['CPS'] = df['Condition Cleanses'] / df['Duration']
+        df['RPS'] = df['Boon Strips'] / df['Duration']
+        df['HPS'] = df['Total Healing'] / df['Duration']
 
     except Exception as e:
         print(e)
@@ -90,12 +102,16 @@ def parse_contents(contents, filename, date):
         html.Hr(),
 
         dash_table.DataTable(
-            data=df.to_dict('records'),
+            id='data-table',
+            data=df.head(PAGE_SIZE).to_dict('records'),
             columns=[{'name': i, 'id': i} for i in df.columns],
             style_table={'height': '300px', 'maxheight': '300px', 'overflowY': 'auto', 'overflowX': 'auto'},
-            page_size=15
+            page_action='custom',
+            page_current=0,
+            page_size=PAGE_SIZE,
+            page_count=math.ceil(len(df) / PAGE_SIZE)
         ),
-        dcc.Store(id='stored-data', data=df.to_dict('records')),
+        dcc.Store(id='stored-data', data=df_to_store(df)),
 
         html.Hr(),  # horizontal line
 
@@ -120,6 +136,18 @@ def update_output(list_of_contents, list_of_names, list_of_dates):
         return children
 
 
+@app.callback(Output('data-table', 'data'),
+              Input('data-table', 'page_current'),
+              Input('data-table', 'page_size'),
+              State('stored-data', 'data'))
+def update_table_page(page_current, page_size, stored):
+    if stored is None:
+        return dash.no_update
+    df = df_from_store(stored)
+    start = page_current * page_size
+    return df.iloc[start:start + page_size].to_dict('records')
+
+
 @app.callback(Output('output-div', 'children'),
               Input('submit-button','n_clicks'),
               State('stored-data','data'),
@@ -133,7 +161,8 @@ def make_graphs(n, data, x_data, y_data, c_data, s_data, tick_mode):
     if n is None:
         return dash.no_update
     else:
-        scatter_fig = px.scatter(data, x=x_data, y=y_data, color=c_data, size=s_data, hover_data=['Name','Profession', 'Role'])
+        df = df_from_store(data)
+        scatter_fig = px.scatter(df, x=x_data, y=y_data, color=c_data, size=s_data, hover_data=['Name','Profession', 'Role'])
         
 
         if 'linear' in tick_mode: